@@ -1,37 +1,102 @@
 import customtkinter as ctk
 from tkinter import filedialog, Tk, PhotoImage
 import threading
+import queue
+import collections
 import os
 import json
 import time
-from typing import List, Optional
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 from pathlib import Path
-from PIL import Image, ImageTk
-from video_processor import split_video, extract_audio, merge_videos, trim_video
+
+if TYPE_CHECKING:
+    from PIL import Image  # Imported lazily at runtime to keep startup fast
 
 try:
     from tkinterdnd2 import TkinterDnD, DND_FILES
     HAS_DND = True
+    _DnDBase = TkinterDnD.DnDWrapper
 except ImportError:
     HAS_DND = False
+    _DnDBase = object
 
 APP_TITLE = "Video Splitter Pro"
 APP_SIZE = "600x800" # Reduced height for better HD screen compatibility
 COLOR_ACCENT = "#2CC985"
 CONFIG_FILE = "config.json"
+QUEUE_POLL_MS = 50 # How often the GUI drains worker events while processing
+EVENT_QUEUE_SIZE = 256 # Bound on pending worker events; logs block, progress is dropped when full
+EVENT_PUT_TIMEOUT = 0.2 # Seconds between checks for a closed window while the event queue is full
+MAX_WORKERS = min(4, os.cpu_count() or 1) # Files processed concurrently; bounded to avoid disk thrashing
+THUMB_CACHE_DIR = Path.home() / ".cache" / "video_splitter" / "thumbs"
+THUMB_SIZE = (120, 80)
+THUMB_ROW_HEIGHT = THUMB_SIZE[1] + 10
+VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv', '.ts', '.mpg', '.mpeg'})
+VIDEO_FILETYPES = (("Video", " ".join(f"*{ext}" for ext in sorted(VIDEO_EXTS))), ("All", "*.*"))
+LOG_FLUSH_MS = 100 # Delay used to batch log messages written from the GUI thread
+LOG_MAX_LINES = 5000 # Trim the activity log once it grows past this
+LOG_TRIM_LINES = 1000 # Number of oldest lines dropped per trim
+
+DEFAULT_CONFIG = {
+    'theme': 'System',
+    'output_dir': '',
+    'naming_pattern': '{name}_part{num}.{ext}',
+    'split_mode': 'Count',
+    'split_count': 5,
+    'audio_format': 'mp3'
+}
+
+# Map UI archive labels to split_video's internal archive modes
+_MODE_MAP = {
+    "No Archive": "NONE",
+    "One Zip": "BUNDLE",
+    "Zip Each Part": "INDIVIDUAL",
+    "Part Folder": "MANIFEST"
+}
+
+def _encoder_threads(file_count: int) -> int:
+    """Share the cores between the FFMPEG encodes a batch runs at once (0 = all cores)"""
+    workers = min(MAX_WORKERS, file_count)
+    if workers <= 1:
+        return 0
+    return max(1, (os.cpu_count() or 1) // workers)
+
+def _thumb_cache_path(video_path: str, size: tuple) -> Path:
+    """Cache location for a video's thumbnail, keyed by path, mtime, file size and thumb size"""
+    st = os.stat(video_path)
+    key = f"{os.path.abspath(video_path)}|{st.st_mtime}|{st.st_size}|{size[0]}x{size[1]}"
+    return THUMB_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.jpg"
 
-class VideoSplitterApp(ctk.CTk):
+@functools.lru_cache(maxsize=128)
+def _decode_thumb(cache_path: str, mtime: float):
+    """Decode a cached thumbnail JPEG once per (path, mtime); callers must not modify it"""
+    from PIL import Image
+    
+    # Load fully so the file handle is released before returning
+    with Image.open(cache_path) as pil_image:
+        return pil_image.copy()
+
+class VideoSplitterApp(ctk.CTk, _DnDBase):
     def __init__(self):
         super().__init__()
         
-        # Load configuration
-        self.config = self.load_config()
+        # Start from defaults; config.json is read in the background after first paint
+        self.config = dict(DEFAULT_CONFIG)
+        self._config_lock = threading.Lock()
+        self._last_config_hash = None
+        self._save_after_id = None
         
-        # Enable drag-and-drop if available
+        # Enable drag-and-drop if available, loading tkdnd into this interpreter
         if HAS_DND:
-            TkinterDnD.Tk().withdraw()
-            self.drop_target_register(DND_FILES)
-            self.dnd_bind('<<Drop>>', self.on_drop)
+            try:
+                self.TkdndVersion = TkinterDnD._require(self)
+                self.drop_target_register(DND_FILES)
+                self.dnd_bind('<<Drop>>', self.on_drop)
+            except RuntimeError as e:
+                print(f"Drag-and-drop unavailable: {e}")
         
         self.title(APP_TITLE)
         self.geometry(APP_SIZE)
@@ -48,17 +113,46 @@ class VideoSplitterApp(ctk.CTk):
         # Set minimum size to prevent UI from being squashed
         self.minsize(550, 700)
         
-        self.file_queue: List[str] = []
+        self.file_queue: Tuple[str, ...] = ()
+        self._basenames: Tuple[str, ...] = ()
         self.is_processing = False
         
+        # Worker -> GUI event queue, drained periodically on the main thread
+        self._event_q: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        
+        # Single long-lived worker that runs queued batch jobs
+        self._jobs: queue.Queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._closing = threading.Event()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        self._last_progress: Optional[float] = None
+        self._last_status = "Ready"
+        
+        # Last rendered widget states, used to skip no-op reconfigures
+        self._last_slider_int = 5
+        self._last_archive_mode = "One Zip"
+        self._log_buf: collections.deque = collections.deque()
+        self._log_flush_id = None
+        
         # Progress tracking variables
         self.process_start_time = None
         self.processed_bytes = 0
         self.total_bytes = 0
+        self._last_stats_render = 0.0
         
         # Thumbnail preview variables
-        self.thumbnail_labels = []
-        self.current_thumbnails = []
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4)
+        self._thumb_sheet = None
+        self._thumb_photo = None
+        self._thumb_flush_id = None
+        self.canvas_thumbnails = None
+        self._thumb_futures = []
+        self._thumb_generation = 0
+        self._thumb_images = {}
+        try:
+            THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating thumbnail cache: {e}")
         
         # Apply theme from config
         self.apply_theme(self.config.get('theme', 'System'))
@@ -69,19 +163,13 @@ class VideoSplitterApp(ctk.CTk):
         
         # Save config on close
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(50, self.start_config_load)
 
     # --- CONFIGURATION METHODS ---
     
     def load_config(self) -> dict:
-        """Load configuration from config.json file"""
-        default_config = {
-            'theme': 'System',
-            'output_dir': '',
-            'naming_pattern': '{name}_part{num}.{ext}',
-            'split_mode': 'Count',
-            'split_count': 5,
-            'audio_format': 'mp3'
-        }
+        """Load configuration from config.json file (no Tk calls; safe off the main thread)"""
+        default_config = dict(DEFAULT_CONFIG)
         
         try:
             if os.path.exists(CONFIG_FILE):
@@ -94,8 +182,25 @@ class VideoSplitterApp(ctk.CTk):
         
         return default_config
     
+    def start_config_load(self):
+        """Read config.json in the background once the window is up"""
+        def worker():
+            config = self.load_config()
+            self.after(0, self.apply_loaded_config, config)
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def apply_loaded_config(self, config: dict):
+        """Apply settings read by start_config_load (main thread)"""
+        self.config = config
+        theme = config.get('theme', 'System')
+        if theme != self.theme_var.get():
+            self.theme_var.set(theme)
+            self.apply_theme(theme)
+            self.recolor_thumbnail_canvas()
+    
     def save_config(self):
-        """Save current configuration to config.json file"""
+        """Save current configuration to config.json file, skipping unchanged settings"""
+        self._save_after_id = None
         try:
             config_to_save = {
                 'theme': self.theme_var.get(),
@@ -106,11 +211,37 @@ class VideoSplitterApp(ctk.CTk):
                 'audio_format': self.audio_format_var.get()
             }
             
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config_to_save, f, indent=2)
+            config_hash = hash(json.dumps(config_to_save, sort_keys=True))
+            if config_hash == self._last_config_hash:
+                return
+            self._last_config_hash = config_hash
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            return
+        
+        # Widgets are read above on the main thread; the disk write happens in a
+        # non-daemon thread so closing the window never waits on it, yet the
+        # process still finishes the write before exiting
+        threading.Thread(target=self._write_config, args=(config_to_save,)).start()
+    
+    def _write_config(self, config_to_save: dict):
+        """Write the config atomically (worker thread)"""
+        try:
+            with self._config_lock:
+                # Write to a temp file and swap it in so a crash can't truncate the config
+                tmp_path = f"{CONFIG_FILE}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(config_to_save, f, indent=2)
+                os.replace(tmp_path, CONFIG_FILE)
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    def schedule_save_config(self, delay_ms: int = 500):
+        """Debounce config saves so bursts of setting changes cause a single write"""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(delay_ms, self.save_config)
+    
     def apply_theme(self, theme: str):
         """Apply the selected theme to the application"""
         if theme == 'Dark':
@@ -122,7 +253,15 @@ class VideoSplitterApp(ctk.CTk):
     
     def on_close(self):
         """Handle window close event - save config and destroy window"""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
         self.save_config()
+        # Stop a running batch: its pool threads are non-daemon and would
+        # otherwise keep the closed app alive until every file is done
+        self._closing.set()
+        if self.is_processing:
+            self._cancel.set()
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
         self.destroy()
     
     # --- PROGRESS STATS METHODS ---
@@ -131,18 +270,32 @@ class VideoSplitterApp(ctk.CTk):
         """Initialize progress tracking variables"""
         self.process_start_time = time.time()
         self.processed_bytes = 0
-        self.total_bytes = sum(os.path.getsize(f) for f in self.file_queue if os.path.exists(f))
+        
+        # One stat per file; missing files simply don't count
+        total = 0
+        for f in self.file_queue:
+            try:
+                total += os.stat(f).st_size
+            except OSError:
+                pass
+        self.total_bytes = total
     
     def update_progress_stats(self, progress: float):
-        """Update progress statistics (ETA, speed, elapsed time)"""
+        """Update progress statistics (ETA, speed, elapsed time), at most ~10 times per second"""
         if self.process_start_time is None:
             return
         
+        # Throttle label refreshes; always render the final update
+        now = time.monotonic()
+        if now - self._last_stats_render < 0.1 and progress < 1.0:
+            return
+        self._last_stats_render = now
+        
         elapsed = time.time() - self.process_start_time
         
-        # Update elapsed time label
+        # Elapsed time
         minutes, seconds = divmod(int(elapsed), 60)
-        self.after(0, lambda: self.label_elapsed.configure(text=f"Elapsed: {minutes}:{seconds:02d}"))
+        elapsed_text = f"Elapsed: {minutes}:{seconds:02d}"
         
         # Calculate speed and ETA
         if elapsed > 0 and progress > 0:
@@ -152,7 +305,7 @@ class VideoSplitterApp(ctk.CTk):
             
             # Convert to MB/s for display
             speed_mb = speed / (1024 * 1024)
-            self.after(0, lambda: self.label_speed.configure(text=f"Speed: {speed_mb:.2f} MB/s"))
+            speed_text = f"Speed: {speed_mb:.2f} MB/s"
             
             # Calculate ETA
             if progress < 1.0:
@@ -162,27 +315,46 @@ class VideoSplitterApp(ctk.CTk):
                     eta_minutes, eta_seconds = divmod(int(eta_seconds), 60)
                     if eta_minutes > 60:
                         eta_hours, eta_minutes = divmod(eta_minutes, 60)
-                        self.after(0, lambda: self.label_eta.configure(text=f"ETA: {eta_hours}h {eta_minutes}m"))
+                        eta_text = f"ETA: {eta_hours}h {eta_minutes}m"
                     else:
-                        self.after(0, lambda: self.label_eta.configure(text=f"ETA: {eta_minutes}:{eta_seconds:02d}"))
+                        eta_text = f"ETA: {eta_minutes}:{eta_seconds:02d}"
                 else:
-                    self.after(0, lambda: self.label_eta.configure(text="ETA: --:--"))
+                    eta_text = "ETA: --:--"
             else:
-                self.after(0, lambda: self.label_eta.configure(text="ETA: Done"))
+                eta_text = "ETA: Done"
         else:
-            self.after(0, lambda: self.label_speed.configure(text="Speed: -- MB/s"))
-            self.after(0, lambda: self.label_eta.configure(text="ETA: --:--"))
+            speed_text = "Speed: -- MB/s"
+            eta_text = "ETA: --:--"
+        
+        self._apply_stats(elapsed_text, speed_text, eta_text)
+    
+    def _apply_stats(self, elapsed_text: str, speed_text: str, eta_text: str):
+        """Render all progress stat labels in one pass"""
+        self.label_elapsed.configure(text=elapsed_text)
+        self.label_speed.configure(text=speed_text)
+        self.label_eta.configure(text=eta_text)
     
     def reset_progress_stats(self):
         """Reset progress statistics"""
         self.process_start_time = None
         self.processed_bytes = 0
         self.total_bytes = 0
-        self.after(0, lambda: self.label_eta.configure(text="ETA: --:--"))
-        self.after(0, lambda: self.label_speed.configure(text="Speed: -- MB/s"))
-        self.after(0, lambda: self.label_elapsed.configure(text="Elapsed: 0:00"))
+        self._apply_stats("Elapsed: 0:00", "Speed: -- MB/s", "ETA: --:--")
+
+    def setup_fonts(self):
+        """Create shared font objects once so all widgets reuse the same Tcl fonts"""
+        self.font_title = ctk.CTkFont(family="Roboto", size=28, weight="bold")
+        self.font_button = ctk.CTkFont(family="Roboto", size=16, weight="bold")
+        self.font_section = ctk.CTkFont(family="Roboto", size=14, weight="bold")
+        self.font_label = ctk.CTkFont(family="Roboto", size=13)
+        self.font_label_bold = ctk.CTkFont(family="Roboto", size=13, weight="bold")
+        self.font_note = ctk.CTkFont(family="Roboto", size=11)
+        self.font_hint = ctk.CTkFont(family="Roboto", size=10)
+        self.font_log = ctk.CTkFont(family="Consolas", size=12)
 
     def setup_ui(self):
+        self.setup_fonts()
+        
         # Create main scrollable container
         self.frame_scrollable = ctk.CTkScrollableFrame(self, label_text="")
         self.frame_scrollable.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
@@ -190,7 +362,7 @@ class VideoSplitterApp(ctk.CTk):
         # Header
         self.frame_header = ctk.CTkFrame(self.frame_scrollable, fg_color="transparent")
         self.frame_header.pack(fill="x", pady=(20, 10))
-        ctk.CTkLabel(self.frame_header, text=APP_TITLE, font=("Roboto", 28, "bold")).pack()
+        ctk.CTkLabel(self.frame_header, text=APP_TITLE, font=self.font_title).pack()
         ctk.CTkLabel(self.frame_header, text="Advanced Video Processor", text_color="gray").pack()
         
         # Theme Toggle
@@ -209,7 +381,7 @@ class VideoSplitterApp(ctk.CTk):
         # Selection
         self.frame_file = ctk.CTkFrame(self.frame_scrollable, corner_radius=15)
         self.frame_file.pack(fill="x", padx=20, pady=10)
-        ctk.CTkLabel(self.frame_file, text="1. Select Videos", font=("Roboto", 14, "bold")).pack(anchor="w", padx=15, pady=(15, 5))
+        ctk.CTkLabel(self.frame_file, text="1. Select Videos", font=self.font_section).pack(anchor="w", padx=15, pady=(15, 5))
         
         self.btn_select = ctk.CTkButton(self.frame_file, text="Choose Files...", command=self.select_files)
         self.btn_select.pack(padx=15, pady=(0, 10), fill="x")
@@ -217,7 +389,7 @@ class VideoSplitterApp(ctk.CTk):
         self.label_file_count.pack(padx=15, pady=(0, 15))
 
         # Output Directory
-        ctk.CTkLabel(self.frame_file, text="Output Folder:", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(5, 5))
+        ctk.CTkLabel(self.frame_file, text="Output Folder:", font=self.font_label).pack(anchor="w", padx=15, pady=(5, 5))
         self.frame_output = ctk.CTkFrame(self.frame_file, fg_color="transparent")
         self.frame_output.pack(fill="x", padx=15, pady=(0, 15))
         
@@ -229,11 +401,10 @@ class VideoSplitterApp(ctk.CTk):
         # Thumbnail Preview Section
         self.frame_thumbnails = ctk.CTkFrame(self.frame_scrollable, corner_radius=15)
         self.frame_thumbnails.pack(fill="x", padx=20, pady=10)
-        ctk.CTkLabel(self.frame_thumbnails, text="Video Thumbnails", font=("Roboto", 14, "bold")).pack(anchor="w", padx=15, pady=(15, 5))
+        ctk.CTkLabel(self.frame_thumbnails, text="Video Thumbnails", font=self.font_section).pack(anchor="w", padx=15, pady=(15, 5))
         
         # Scrollable thumbnail container
-        self.frame_thumbnail_scroll = ctk.CTkScrollableFrame(self.frame_thumbnails, height=150)
-        self.frame_thumbnail_scroll.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        self.create_thumbnail_scroll()
         
         # Placeholder text when no thumbnails
         self.label_no_thumbnails = ctk.CTkLabel(self.frame_thumbnail_scroll, text="No videos selected", text_color="gray")
@@ -265,23 +436,26 @@ class VideoSplitterApp(ctk.CTk):
         # Progress Stats Labels
         self.frame_stats = ctk.CTkFrame(self.frame_action, fg_color="transparent")
         self.frame_stats.pack(fill="x", pady=(0, 10))
-        self.label_eta = ctk.CTkLabel(self.frame_stats, text="ETA: --:--", text_color="gray", font=("Roboto", 10))
+        self.label_eta = ctk.CTkLabel(self.frame_stats, text="ETA: --:--", text_color="gray", font=self.font_hint)
         self.label_eta.pack(side="left", padx=(0, 20))
-        self.label_speed = ctk.CTkLabel(self.frame_stats, text="Speed: -- MB/s", text_color="gray", font=("Roboto", 10))
+        self.label_speed = ctk.CTkLabel(self.frame_stats, text="Speed: -- MB/s", text_color="gray", font=self.font_hint)
         self.label_speed.pack(side="left", padx=(0, 20))
-        self.label_elapsed = ctk.CTkLabel(self.frame_stats, text="Elapsed: 0:00", text_color="gray", font=("Roboto", 10))
+        self.label_elapsed = ctk.CTkLabel(self.frame_stats, text="Elapsed: 0:00", text_color="gray", font=self.font_hint)
         self.label_elapsed.pack(side="left")
         
         self.btn_run = ctk.CTkButton(self.frame_action, text="START PROCESS", command=self.start_batch_thread,
-                                     fg_color=COLOR_ACCENT, hover_color="#229965", height=45, font=("Roboto", 16, "bold"))
+                                     fg_color=COLOR_ACCENT, hover_color="#229965", height=45, font=self.font_button)
         self.btn_run.pack(fill="x")
+        self.btn_cancel = ctk.CTkButton(self.frame_action, text="Cancel", command=self.cancel_batch,
+                                        fg_color="gray", state="disabled", height=30)
+        self.btn_cancel.pack(fill="x", pady=(5, 0))
         self.label_status = ctk.CTkLabel(self.frame_action, text="Ready", text_color="gray")
         self.label_status.pack(pady=(5, 0))
 
         # Log
         self.frame_log = ctk.CTkFrame(self.frame_scrollable)
         self.frame_log.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        self.textbox_log = ctk.CTkTextbox(self.frame_log, font=("Consolas", 12))
+        self.textbox_log = ctk.CTkTextbox(self.frame_log, font=self.font_log)
         self.textbox_log.pack(fill="both", expand=True, padx=5, pady=5)
 
     # --- TAB SETUP METHODS ---
@@ -289,7 +463,7 @@ class VideoSplitterApp(ctk.CTk):
     def setup_split_tab(self):
         """Setup the Split tab with all split options"""
         # Split Mode Selection
-        ctk.CTkLabel(self.tab_split, text="Split Mode:", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(15, 5))
+        ctk.CTkLabel(self.tab_split, text="Split Mode:", font=self.font_label).pack(anchor="w", padx=15, pady=(15, 5))
         self.split_mode_var = ctk.StringVar(value="Count")
         self.seg_split_mode = ctk.CTkSegmentedButton(
             self.tab_split,
@@ -303,7 +477,7 @@ class VideoSplitterApp(ctk.CTk):
         self.frame_count_mode = ctk.CTkFrame(self.tab_split, fg_color="transparent")
         self.frame_count_mode.pack(fill="x", padx=15, pady=5)
         ctk.CTkLabel(self.frame_count_mode, text="Split Count:").pack(side="left")
-        self.label_slider_val = ctk.CTkLabel(self.frame_count_mode, text="5 Parts", font=("Roboto", 13, "bold"), text_color="#3B8ED0")
+        self.label_slider_val = ctk.CTkLabel(self.frame_count_mode, text="5 Parts", font=self.font_label_bold, text_color="#3B8ED0")
         self.label_slider_val.pack(side="right")
         self.slider = ctk.CTkSlider(self.tab_split, from_=2, to=20, number_of_steps=18, command=self.update_slider)
         self.slider.set(5)
@@ -329,20 +503,29 @@ class VideoSplitterApp(ctk.CTk):
             variable=self.var_precise_mode
         )
         self.chk_precise_mode.pack(anchor="w", padx=15, pady=(10, 5))
-        ctk.CTkLabel(self.tab_split, text="⚠ Slower but more accurate cuts", font=("Roboto", 10), text_color="gray").pack(anchor="w", padx=30, pady=(0, 15))
+        ctk.CTkLabel(self.tab_split, text="⚠ Slower but more accurate cuts", font=self.font_hint, text_color="gray").pack(anchor="w", padx=30, pady=(0, 5))
+        
+        # Hardware Encoding Checkbox
+        self.var_hw_encode = ctk.IntVar(value=0)
+        self.chk_hw_encode = ctk.CTkCheckBox(
+            self.tab_split,
+            text="Use GPU encoder when re-encoding",
+            variable=self.var_hw_encode
+        )
+        self.chk_hw_encode.pack(anchor="w", padx=30, pady=(0, 15))
 
         # Custom Naming Pattern
-        ctk.CTkLabel(self.tab_split, text="Naming Pattern:", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(5, 5))
+        ctk.CTkLabel(self.tab_split, text="Naming Pattern:", font=self.font_label).pack(anchor="w", padx=15, pady=(5, 5))
         self.entry_naming = ctk.CTkEntry(self.tab_split, placeholder_text="{name}_part{num}.{ext}")
         self.entry_naming.pack(fill="x", padx=15, pady=(0, 5))
-        ctk.CTkLabel(self.tab_split, text="Variables: {name}, {num}, {ext}", font=("Roboto", 10), text_color="gray").pack(anchor="w", padx=15, pady=(0, 15))
+        ctk.CTkLabel(self.tab_split, text="Variables: {name}, {num}, {ext}", font=self.font_hint, text_color="gray").pack(anchor="w", padx=15, pady=(0, 15))
 
         # Archive Controls
-        ctk.CTkLabel(self.tab_split, text="Output Format:", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(5, 5))
+        ctk.CTkLabel(self.tab_split, text="Output Format:", font=self.font_label).pack(anchor="w", padx=15, pady=(5, 5))
         self.archive_mode_var = ctk.StringVar(value="One Zip")
         self.seg_button = ctk.CTkSegmentedButton(
             self.tab_split,
-            values=["No Archive", "One Zip", "Zip Each Part"],
+            values=["No Archive", "One Zip", "Zip Each Part", "Part Folder"],
             variable=self.archive_mode_var,
             command=self.on_mode_change
         )
@@ -351,14 +534,14 @@ class VideoSplitterApp(ctk.CTk):
         # Cleanup Option
         self.var_cleanup = ctk.IntVar(value=0)
         self.cb_cleanup = ctk.CTkCheckBox(
-            self.tab_split, text="Delete raw .mp4 parts after zipping",
+            self.tab_split, text="Delete raw .mp4 parts after packaging",
             variable=self.var_cleanup, state="normal"
         )
         self.cb_cleanup.pack(anchor="w", padx=15, pady=(0, 15))
 
     def setup_audio_tab(self):
         """Setup the Extract Audio tab"""
-        ctk.CTkLabel(self.tab_audio, text="Audio Format:", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(15, 5))
+        ctk.CTkLabel(self.tab_audio, text="Audio Format:", font=self.font_label).pack(anchor="w", padx=15, pady=(15, 5))
         self.audio_format_var = ctk.StringVar(value="mp3")
         self.seg_audio_format = ctk.CTkSegmentedButton(
             self.tab_audio,
@@ -367,39 +550,44 @@ class VideoSplitterApp(ctk.CTk):
         )
         self.seg_audio_format.pack(fill="x", padx=15, pady=(0, 15))
         
-        ctk.CTkLabel(self.tab_audio, text="Extract audio from all selected videos", font=("Roboto", 11), text_color="gray").pack(anchor="w", padx=15)
+        ctk.CTkLabel(self.tab_audio, text="Extract audio from all selected videos", font=self.font_note, text_color="gray").pack(anchor="w", padx=15)
 
     def setup_merge_tab(self):
         """Setup the Merge tab"""
-        ctk.CTkLabel(self.tab_merge, text="Merge Videos", font=("Roboto", 14, "bold")).pack(anchor="w", padx=15, pady=(15, 5))
-        ctk.CTkLabel(self.tab_merge, text="Combine multiple videos into one file", font=("Roboto", 11), text_color="gray").pack(anchor="w", padx=15, pady=(0, 15))
-        ctk.CTkLabel(self.tab_merge, text="⚠ Videos must have same resolution and codec", font=("Roboto", 10), text_color="orange").pack(anchor="w", padx=15, pady=(0, 15))
+        ctk.CTkLabel(self.tab_merge, text="Merge Videos", font=self.font_section).pack(anchor="w", padx=15, pady=(15, 5))
+        ctk.CTkLabel(self.tab_merge, text="Combine multiple videos into one file", font=self.font_note, text_color="gray").pack(anchor="w", padx=15, pady=(0, 15))
+        ctk.CTkLabel(self.tab_merge, text="⚠ Videos must have same resolution and codec", font=self.font_hint, text_color="orange").pack(anchor="w", padx=15, pady=(0, 15))
 
     def setup_trim_tab(self):
         """Setup the Trim tab"""
-        ctk.CTkLabel(self.tab_trim, text="Trim Videos", font=("Roboto", 14, "bold")).pack(anchor="w", padx=15, pady=(15, 5))
+        ctk.CTkLabel(self.tab_trim, text="Trim Videos", font=self.font_section).pack(anchor="w", padx=15, pady=(15, 5))
         
         # Start Time
-        ctk.CTkLabel(self.tab_trim, text="Start Time (seconds):", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(10, 5))
+        ctk.CTkLabel(self.tab_trim, text="Start Time (seconds):", font=self.font_label).pack(anchor="w", padx=15, pady=(10, 5))
         self.entry_trim_start = ctk.CTkEntry(self.tab_trim, placeholder_text="e.g., 0")
         self.entry_trim_start.pack(fill="x", padx=15, pady=(0, 10))
         
         # End Time
-        ctk.CTkLabel(self.tab_trim, text="End Time (seconds):", font=("Roboto", 13)).pack(anchor="w", padx=15, pady=(5, 5))
+        ctk.CTkLabel(self.tab_trim, text="End Time (seconds):", font=self.font_label).pack(anchor="w", padx=15, pady=(5, 5))
         self.entry_trim_end = ctk.CTkEntry(self.tab_trim, placeholder_text="e.g., 60")
         self.entry_trim_end.pack(fill="x", padx=15, pady=(0, 15))
         
-        ctk.CTkLabel(self.tab_trim, text="Trim each video to specified time range", font=("Roboto", 11), text_color="gray").pack(anchor="w", padx=15)
+        ctk.CTkLabel(self.tab_trim, text="Trim each video to specified time range", font=self.font_note, text_color="gray").pack(anchor="w", padx=15)
 
     # --- LOGIC ---
 
     def select_files(self):
-        paths = filedialog.askopenfilenames(title="Select videos", filetypes=(("Video", "*.mp4 *.mov *.avi"), ("All", "*.*")))
+        paths = filedialog.askopenfilenames(title="Select videos", filetypes=VIDEO_FILETYPES)
         if paths:
-            self.file_queue = list(paths)
-            self.label_file_count.configure(text=f"{len(paths)} Videos Selected", text_color="white")
-            self.log(f"Selected {len(paths)} files.")
-            self.update_thumbnails()
+            self.set_file_queue(paths)
+            self.log(f"Selected {len(self.file_queue)} files.")
+
+    def set_file_queue(self, paths: Sequence[str]):
+        """Replace the selected files, caching their basenames once"""
+        self.file_queue = tuple(paths)
+        self._basenames = tuple(os.path.basename(p) for p in self.file_queue)
+        self.label_file_count.configure(text=f"{len(self.file_queue)} Videos Selected", text_color="white")
+        self.update_thumbnails()
 
     def select_output_folder(self):
         folder = filedialog.askdirectory(title="Select Output Folder")
@@ -411,35 +599,28 @@ class VideoSplitterApp(ctk.CTk):
     def on_drop(self, event):
         """Handle drag-and-drop file drops"""
         try:
-            # Parse dropped files (tkinterdnd2 provides files as space-separated paths)
-            dropped_files = event.data
-            if dropped_files:
-                # Handle both Windows (curly braces) and Unix paths
-                if dropped_files.startswith('{') and dropped_files.endswith('}'):
-                    dropped_files = dropped_files[1:-1]
-                
-                # Split by spaces and filter valid files
-                file_paths = []
-                for path in dropped_files.split():
-                    path = path.strip('"{}')  # Remove quotes and braces
-                    if os.path.isfile(path):
-                        # Check if it's a video file
-                        ext = os.path.splitext(path)[1].lower()
-                        if ext in ['.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv']:
-                            file_paths.append(path)
-                
-                if file_paths:
-                    self.file_queue = file_paths
-                    self.label_file_count.configure(text=f"{len(file_paths)} Videos Selected", text_color="white")
-                    self.log(f"Dropped {len(file_paths)} files.")
-                    self.update_thumbnails()
-                else:
-                    self.log("No valid video files dropped.")
+            # Tk brace-quotes paths containing spaces; splitlist unpacks them natively
+            paths = self.tk.splitlist(event.data)
+            file_paths = [
+                p for p in paths
+                if os.path.splitext(p)[1].lower() in VIDEO_EXTS and os.path.isfile(p)
+            ]
+            
+            if file_paths:
+                self.set_file_queue(file_paths)
+                self.log(f"Dropped {len(self.file_queue)} files.")
+            else:
+                self.log("No valid video files dropped.")
         except Exception as e:
             self.log(f"Error handling drop: {e}")
 
     def update_slider(self, val):
-        self.label_slider_val.configure(text=f"{int(val)} Parts")
+        # The slider fires many float updates per integer step
+        parts = int(val)
+        if parts == self._last_slider_int:
+            return
+        self._last_slider_int = parts
+        self.label_slider_val.configure(text=f"{parts} Parts")
 
     def on_split_mode_change(self, value):
         if value == "Count":
@@ -456,6 +637,10 @@ class VideoSplitterApp(ctk.CTk):
             self.frame_size_mode.pack(fill="x", padx=15, pady=5)
 
     def on_mode_change(self, value):
+        if value == self._last_archive_mode:
+            return
+        self._last_archive_mode = value
+        
         # Disable cleanup if "No Archive" is selected
         if value == "No Archive":
             self.cb_cleanup.deselect()
@@ -466,105 +651,183 @@ class VideoSplitterApp(ctk.CTk):
     def on_theme_change(self, value):
         """Handle theme change event"""
         self.apply_theme(value)
-        self.save_config()
+        self.recolor_thumbnail_canvas()
+        self.schedule_save_config()
     
     # --- THUMBNAIL PREVIEW METHODS ---
     
+    def create_thumbnail_scroll(self):
+        """Create the scrollable container that holds the thumbnail rows"""
+        self.frame_thumbnail_scroll = ctk.CTkScrollableFrame(self.frame_thumbnails, height=150)
+        self.frame_thumbnail_scroll.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+    
     def update_thumbnails(self):
-        """Generate and display thumbnails for selected videos"""
-        # Clear existing thumbnails
-        for widget in self.frame_thumbnail_scroll.winfo_children():
-            widget.destroy()
+        """Lay out the thumbnail list and generate the images in the background"""
+        # Results still in flight for a previous selection are discarded
+        self._thumb_generation += 1
+        for future in self._thumb_futures:
+            future.cancel()
+        self._thumb_futures = []
+        
+        # Clear existing thumbnails by swapping in a fresh container, so Tk
+        # relayouts once instead of once per destroyed child
+        self.frame_thumbnail_scroll.destroy()
+        self.create_thumbnail_scroll()
+        
+        # Keep decoded thumbnails only for videos that are still selected
+        previous_images = self._thumb_images
+        self._thumb_images = {}
         
         if not self.file_queue:
             self.label_no_thumbnails = ctk.CTkLabel(self.frame_thumbnail_scroll, text="No videos selected", text_color="gray")
             self.label_no_thumbnails.pack(pady=20)
             return
         
-        # Generate thumbnails for each video
+        # Pillow is only imported once thumbnails are actually needed
+        from PIL import Image, ImageTk
+        
+        # All thumbnails share one sprite sheet: a single PIL bitmap backing a
+        # single Tk image on a single canvas, instead of one image + label per video
+        thumb_width, thumb_height = THUMB_SIZE
+        sheet_height = THUMB_ROW_HEIGHT * len(self.file_queue)
+        self._thumb_sheet = Image.new("RGBA", (thumb_width, sheet_height), (0, 0, 0, 0))
+        
+        # Videos that were already selected reuse their thumbnail; only new
+        # entries go through FFMPEG
+        pending = []
         for idx, video_path in enumerate(self.file_queue):
-            try:
-                thumbnail_frame = ctk.CTkFrame(self.frame_thumbnail_scroll, fg_color="transparent")
-                thumbnail_frame.pack(fill="x", pady=5, padx=5)
-                
-                # Generate thumbnail image
-                thumbnail_image = self.generate_thumbnail(video_path)
-                
-                if thumbnail_image:
-                    # Create label with thumbnail
-                    img_label = ctk.CTkLabel(thumbnail_frame, image=thumbnail_image, text="")
-                    img_label.image = thumbnail_image  # Keep reference
-                    img_label.pack(side="left", padx=(0, 10))
-                
-                # Add filename label
-                filename = os.path.basename(video_path)
-                name_label = ctk.CTkLabel(
-                    thumbnail_frame,
-                    text=f"{idx+1}. {filename}",
-                    font=("Roboto", 11),
-                    anchor="w"
-                )
-                name_label.pack(side="left", fill="x", expand=True)
-                
-            except Exception as e:
-                self.log(f"Error generating thumbnail for {video_path}: {e}")
+            pil_image = previous_images.get(video_path)
+            if pil_image is None:
+                pending.append((idx, video_path))
+            else:
+                self._thumb_images[video_path] = pil_image
+                self._thumb_sheet.paste(pil_image, (0, self._thumb_row_offset(idx)))
+        self._thumb_photo = ImageTk.PhotoImage(self._thumb_sheet)
+        
+        bg_color, text_color = self._thumb_canvas_colors()
+        self.canvas_thumbnails = ctk.CTkCanvas(self.frame_thumbnail_scroll, height=sheet_height, bg=bg_color, highlightthickness=0)
+        self.canvas_thumbnails.pack(fill="x", padx=5)
+        self.canvas_thumbnails.create_image(0, 0, image=self._thumb_photo, anchor="nw")
+        
+        # Filename labels next to where each thumbnail is blitted
+        for idx, filename in enumerate(self._basenames):
+            row_center = idx * THUMB_ROW_HEIGHT + THUMB_ROW_HEIGHT // 2
+            self.canvas_thumbnails.create_text(
+                thumb_width + 10, row_center,
+                text=f"{idx+1}. {filename}",
+                font=self.font_note, fill=text_color, anchor="w", tags="thumb_text"
+            )
+        
+        generation = self._thumb_generation
+        for idx, video_path in pending:
+            # FFMPEG runs in a subprocess, so threads extract frames in parallel
+            future = self._thumb_pool.submit(self.generate_thumbnail, video_path, THUMB_SIZE)
+            future.add_done_callback(functools.partial(self._on_thumb_done, generation, idx))
+            self._thumb_futures.append(future)
+    
+    def _on_thumb_done(self, generation: int, idx: int, future):
+        """Future callback (worker thread): hand the result to the main thread"""
+        self.after(0, self._install_thumb, generation, idx, future)
+    
+    def _install_thumb(self, generation: int, idx: int, future):
+        """Paste a finished thumbnail into the sprite sheet (main thread only)"""
+        if generation != self._thumb_generation or future.cancelled():
+            return
+        
+        try:
+            pil_image = future.result()
+            if pil_image is None:
+                return
+            
+            self._thumb_images[self.file_queue[idx]] = pil_image
+            self._thumb_sheet.paste(pil_image, (0, self._thumb_row_offset(idx)))
+            
+            # Push the sheet to Tk once per burst of finished thumbnails
+            if self._thumb_flush_id is None:
+                self._thumb_flush_id = self.after(50, self._flush_thumb_sheet)
+        except Exception as e:
+            self.log(f"Error generating thumbnail for {self.file_queue[idx]}: {e}")
+    
+    def _thumb_row_offset(self, idx: int) -> int:
+        """Vertical position of a thumbnail within the sprite sheet"""
+        return idx * THUMB_ROW_HEIGHT + (THUMB_ROW_HEIGHT - THUMB_SIZE[1]) // 2
+    
+    def _flush_thumb_sheet(self):
+        """Copy the composed sprite sheet into its Tk image"""
+        self._thumb_flush_id = None
+        if self._thumb_photo is not None:
+            self._thumb_photo.paste(self._thumb_sheet)
+    
+    def recolor_thumbnail_canvas(self):
+        """Plain Tk canvases don't follow CTk themes, so recolor it by hand"""
+        if self.canvas_thumbnails is None or not self.canvas_thumbnails.winfo_exists():
+            return
+        bg_color, text_color = self._thumb_canvas_colors()
+        self.canvas_thumbnails.configure(bg=bg_color)
+        self.canvas_thumbnails.itemconfigure("thumb_text", fill=text_color)
     
-    def generate_thumbnail(self, video_path: str, size: tuple = (120, 80)) -> Optional[ImageTk.PhotoImage]:
+    def _thumb_canvas_colors(self) -> Tuple[str, str]:
+        """Background and text colors for the thumbnail canvas in the current theme"""
+        bg_color = self._apply_appearance_mode(self.frame_thumbnail_scroll.cget("fg_color"))
+        text_color = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        return bg_color, text_color
+    
+    def generate_thumbnail(self, video_path: str, size: tuple = (120, 80)) -> "Optional[Image.Image]":
         """
-        Generate a thumbnail image from video file.
+        Generate a thumbnail image from video file. Safe to call from a worker thread.
         
         Args:
             video_path: Path to video file
             size: Thumbnail size (width, height)
             
         Returns:
-            ImageTk.PhotoImage object or None if failed
+            PIL Image object or None if failed
         """
         try:
-            from video_processor import FFMPEG_EXE
+            from video_processor import FFMPEG_EXE, FAST_INPUT_FLAGS, FAST_READ_FLAGS, STARTUPINFO, CREATIONFLAGS
             import subprocess
             
-            # Create temporary thumbnail file
-            temp_thumb_path = os.path.join(
-                os.path.dirname(video_path),
-                f".thumb_{os.path.basename(video_path)}.jpg"
-            )
-            
-            # Use FFMPEG to extract a frame at 1 second
-            cmd = [
-                FFMPEG_EXE,
-                "-i", video_path,
-                "-ss", "00:00:01.000",
-                "-vframes", "1",
-                "-vf", f"scale={size[0]}:{size[1]}",
-                "-y",
-                temp_thumb_path
-            ]
-            
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            # Reuse a previously extracted frame if the video is unchanged
+            cache_path = _thumb_cache_path(video_path, size)
             
-            subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                startupinfo=startupinfo
-            )
-            
-            # Load and convert to PhotoImage
-            if os.path.exists(temp_thumb_path):
-                pil_image = Image.open(temp_thumb_path)
-                photo_image = ImageTk.PhotoImage(pil_image)
+            if not cache_path.exists():
+                # Use FFMPEG to extract a frame at 1 second straight into the cache.
+                # Seeking before -i jumps via the keyframe index instead of decoding
+                # from the start, and audio/subtitle streams are skipped entirely.
+                cmd = [
+                    FFMPEG_EXE,
+                    *FAST_INPUT_FLAGS,
+                    *FAST_READ_FLAGS,
+                    "-ss", "00:00:01.000",
+                    "-i", video_path,
+                    "-frames:v", "1",
+                    "-an", "-sn",
+                    "-vf", f"scale={size[0]}:{size[1]}",
+                    "-threads", "1",
+                    "-y",
+                    str(cache_path)
+                ]
                 
-                # Clean up temporary file
-                try:
-                    os.remove(temp_thumb_path)
-                except OSError:
-                    pass
+                # Only the exit code matters, so don't buffer FFMPEG's output
+                process = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    startupinfo=STARTUPINFO,
+                    creationflags=CREATIONFLAGS,
+                    check=False
+                )
                 
-                return photo_image
+                # Don't leave a partial frame behind in the cache
+                if process.returncode != 0:
+                    try:
+                        cache_path.unlink()
+                    except OSError:
+                        pass
+                    return None
+            
+            if cache_path.exists():
+                return _decode_thumb(str(cache_path), os.path.getmtime(cache_path))
             
             return None
             
@@ -573,93 +836,288 @@ class VideoSplitterApp(ctk.CTk):
             return None
 
     def log(self, msg):
-        self.textbox_log.insert("end", f"> {msg}\n")
+        self._log_buf.append(f"> {msg}\n")
+        
+        # Coalesce bursts of messages into one Textbox insert
+        if self._log_flush_id is None:
+            self._log_flush_id = self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered log lines with a single Textbox insert"""
+        if self._log_flush_id is not None:
+            self.after_cancel(self._log_flush_id)
+            self._log_flush_id = None
+        if not self._log_buf:
+            return
+        chunk = "".join(self._log_buf)
+        self._log_buf.clear()
+        self.textbox_log.insert("end", chunk)
+        
+        # Cap the log length so insert/layout cost stays bounded
+        line_count = int(self.textbox_log.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            self.textbox_log.delete("1.0", f"{LOG_TRIM_LINES + 1}.0")
         self.textbox_log.see("end")
 
     def start_batch_thread(self):
         if not self.file_queue: return self.log("Error: No files selected.")
+        
+        # Read all settings here on the main thread, once per batch
+        current_tab = self.tabview.get()
+        try:
+            options = self.read_job_options(current_tab)
+        except ValueError as e:
+            return self.log(f"Error: {e}")
+        
         self.is_processing = True
+        self._cancel.clear()
         self.btn_run.configure(state="disabled")
+        self.btn_cancel.configure(state="normal")
         self.start_progress_tracking()
-        threading.Thread(target=self.run_batch, daemon=True).start()
+        
+        # Snapshot the job so later UI changes don't affect the running batch
+        # (empty output directory means use default)
+        self._jobs.put((current_tab, self.file_queue, self._basenames, self.entry_output.get().strip(), options))
+        self.after(QUEUE_POLL_MS, self._drain_queue)
 
-    def run_batch(self):
-        # Get current tab
-        current_tab = self.tabview.get()
+    def read_job_options(self, current_tab: str) -> dict:
+        """Snapshot the active tab's settings as keyword arguments for its processor"""
+        if current_tab == "Split":
+            split_mode = self.split_mode_var.get()
+            options = {
+                'archive_mode': _MODE_MAP.get(self.archive_mode_var.get(), "BUNDLE"),
+                'cleanup_raw': (self.var_cleanup.get() == 1),
+                'precise_mode': (self.var_precise_mode.get() == 1),
+                'hw_encode': (self.var_hw_encode.get() == 1),
+                'naming_pattern': self.entry_naming.get().strip()
+            }
+            try:
+                if split_mode == "Count":
+                    options['parts'] = int(self.slider.get())
+                elif split_mode == "Duration":
+                    options['duration_per_part'] = float(self.entry_duration.get())
+                else:  # Size mode
+                    options['target_size_mb'] = float(self.entry_size.get())
+            except ValueError:
+                raise ValueError(f"Invalid {split_mode.lower()} value")
+            return options
+        
+        if current_tab == "Extract Audio":
+            return {'output_format': self.audio_format_var.get()}
+        
+        if current_tab == "Trim":
+            try:
+                start_time = float(self.entry_trim_start.get())
+                end_time = float(self.entry_trim_end.get())
+            except ValueError:
+                raise ValueError("Invalid time values")
+            return {
+                'start_time': start_time,
+                'end_time': end_time,
+                'precise_mode': (self.var_precise_mode.get() == 1),
+                'hw_encode': (self.var_hw_encode.get() == 1)
+            }
         
-        # Get custom output directory (empty string means use default)
-        custom_output_dir = self.entry_output.get().strip()
+        return {}
 
-        def on_log(m): self.after(0, lambda: self.log(m))
+    def cancel_batch(self):
+        """Ask the worker to stop the running FFMPEG jobs and skip the rest"""
+        if self.is_processing and not self._cancel.is_set():
+            self._cancel.set()
+            self.btn_cancel.configure(state="disabled")
+            self.log("Cancelling...")
+
+    def _worker_loop(self):
+        """Run queued batch jobs one after another on the worker thread"""
+        while True:
+            job = self._jobs.get()
+            try:
+                self.run_batch(*job)
+            except Exception as e:
+                # Keep the worker alive for the next job
+                self.post_event(("log", f"Error: {e}"))
+
+    def _drain_queue(self):
+        """Apply all pending worker events in one batch on the main thread"""
+        progress = None
+        status = None
+        done = False
+        while True:
+            try:
+                kind, value = self._event_q.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                self._log_buf.append(f"> {value}\n")
+            elif kind == "prog":
+                # Only the latest progress value matters for this tick
+                progress = value
+            elif kind == "status":
+                status = value
+            elif kind == "done":
+                done = True
+        
+        self._flush_log()
+        if status is not None:
+            self.set_status(status)
+        if progress is not None and progress != self._last_progress:
+            # Skip the redraw when the bar would not visibly change
+            self._last_progress = progress
+            self.progress_bar.set(progress)
+            self.update_progress_stats(progress)
+        if done:
+            self.finish_batch()
+        
+        # Keep pumping while the worker runs or events are still pending
+        if self.is_processing or not self._event_q.empty():
+            self.after(QUEUE_POLL_MS, self._drain_queue)
+
+    def set_status(self, text: str):
+        """Update the status label, skipping the redraw if the text is unchanged"""
+        if text == self._last_status:
+            return
+        self._last_status = text
+        self.label_status.configure(text=text)
+
+    def post_event(self, event: tuple):
+        """Queue a worker event, blocking while the GUI catches up but giving up once the window is closed"""
+        while not self._closing.is_set():
+            try:
+                self._event_q.put(event, timeout=EVENT_PUT_TIMEOUT)
+                return
+            except queue.Full:
+                pass
+
+    def post_status(self, text: str):
+        """Queue a status label update from the worker thread"""
+        self.post_event(("status", text))
+
+    def finish_batch(self):
+        """Restore the idle UI state once the worker has finished"""
+        self.is_processing = False
+        self._last_progress = None
+        self.btn_run.configure(state="normal")
+        self.btn_cancel.configure(state="disabled")
+        self.set_status("Cancelled" if self._cancel.is_set() else "Done")
+        self.progress_bar.set(1.0)
+        self.reset_progress_stats()
+
+    def run_batch(self, current_tab: str, files: Tuple[str, ...], names: Tuple[str, ...], custom_output_dir: str, options: dict):
+        def on_log(m): self.post_event(("log", m))
         def on_prog(v):
-            self.after(0, lambda: self.progress_bar.set(v))
-            self.update_progress_stats(v)
+            # Progress is superseded by the next tick, so drop it rather than
+            # block the worker when the GUI falls behind
+            try:
+                self._event_q.put_nowait(("prog", v))
+            except queue.Full:
+                pass
 
         # Process based on selected tab
         try:
             if current_tab == "Split":
-                self.run_split_mode(custom_output_dir, on_log, on_prog)
+                self.run_split_mode(files, names, custom_output_dir, options, on_log, on_prog)
             elif current_tab == "Extract Audio":
-                self.run_audio_mode(custom_output_dir, on_log, on_prog)
+                self.run_audio_mode(files, names, custom_output_dir, options, on_log, on_prog)
             elif current_tab == "Merge":
-                self.run_merge_mode(custom_output_dir, on_log, on_prog)
+                self.run_merge_mode(files, names, custom_output_dir, options, on_log, on_prog)
             elif current_tab == "Trim":
-                self.run_trim_mode(custom_output_dir, on_log, on_prog)
+                self.run_trim_mode(files, names, custom_output_dir, options, on_log, on_prog)
         finally:
-            self.after(0, lambda: self.btn_run.configure(state="normal"))
-            self.after(0, lambda: self.label_status.configure(text="Done"))
-            self.after(0, lambda: self.progress_bar.set(1.0))
-            self.reset_progress_stats()
+            self.post_event(("done", None))
 
-    def run_split_mode(self, custom_output_dir, on_log, on_prog):
-        """Run split video processing"""
-        split_mode = self.split_mode_var.get()
-        mode_label = self.archive_mode_var.get()
-        cleanup = (self.var_cleanup.get() == 1)
-        precise_mode = (self.var_precise_mode.get() == 1)
-        naming_pattern = self.entry_naming.get().strip()
-
-        # Map UI label to Internal Mode
-        mode_map = {
-            "No Archive": "NONE",
-            "One Zip": "BUNDLE",
-            "Zip Each Part": "INDIVIDUAL"
-        }
-        internal_mode = mode_map.get(mode_label, "BUNDLE")
-
-        for idx, fpath in enumerate(self.file_queue):
-            fname = os.path.basename(fpath)
-            self.after(0, lambda: self.label_status.configure(text=f"Processing {idx+1}/{len(self.file_queue)}: {fname}"))
+    def run_file_pool(self, files, names, custom_output_dir, verb, process_one, on_log, on_prog):
+        """
+        Run process_one(fpath, on_progress, on_log) for each file in a bounded
+        thread pool. The work itself happens in FFMPEG subprocesses, so threads
+        overlap files without contending for the GIL.
+        """
+        total = len(files)
+        
+        # Outputs are named after the input's stem, so files like clip.mp4 and
+        # clip.mov (or same-named files sent to one output folder) would write
+        # the same paths. Files sharing an output share a lock and run in turn.
+        output_locks = {}
+        file_locks = []
+        for idx, fpath in enumerate(files):
+            base = Path(custom_output_dir) if custom_output_dir else Path(fpath).parent
+            key = (os.path.normcase(str(base.resolve())), Path(fpath).stem.casefold())
+            if key in output_locks:
+                on_log(f"Warning: {names[idx]} has the same output name as another file; they will run one after another")
+            file_locks.append(output_locks.setdefault(key, threading.Lock()))
+        workers = min(MAX_WORKERS, total)
+        file_progress = [0.0] * total
+        
+        # Weight each file's progress by its share of the batch size, so one
+        # large file doesn't look finished when several small ones are
+        sizes = []
+        for fpath in files:
             try:
-                if split_mode == "Count":
-                    parts = int(self.slider.get())
-                    split_video(fpath, parts=parts, archive_mode=internal_mode, cleanup_raw=cleanup, precise_mode=precise_mode, output_dir=custom_output_dir, naming_pattern=naming_pattern, on_progress=on_prog, on_log=on_log)
-                elif split_mode == "Duration":
-                    duration_per_part = float(self.entry_duration.get())
-                    split_video(fpath, duration_per_part=duration_per_part, archive_mode=internal_mode, cleanup_raw=cleanup, precise_mode=precise_mode, output_dir=custom_output_dir, naming_pattern=naming_pattern, on_progress=on_prog, on_log=on_log)
-                else:  # Size mode
-                    target_size_mb = float(self.entry_size.get())
-                    split_video(fpath, target_size_mb=target_size_mb, archive_mode=internal_mode, cleanup_raw=cleanup, precise_mode=precise_mode, output_dir=custom_output_dir, naming_pattern=naming_pattern, on_progress=on_prog, on_log=on_log)
-                on_log(f"Success: {fname}")
-            except Exception as e:
-                on_log(f"Failed: {fname} ({e})")
+                sizes.append(os.stat(fpath).st_size)
+            except OSError:
+                sizes.append(0)
+        total_size = sum(sizes)
+        weights = [size / total_size for size in sizes] if total_size else [1 / total] * total
+
+        def run_one(idx, fpath):
+            if self._cancel.is_set():
+                return False
+            fname = names[idx]
+
+            def on_file_prog(v):
+                file_progress[idx] = v * weights[idx]
+                on_prog(sum(file_progress))
+
+            def on_file_log(m):
+                on_log(f"[{fname}] {m}" if workers > 1 else m)
 
-    def run_audio_mode(self, custom_output_dir, on_log, on_prog):
+            with file_locks[idx]:
+                # Re-check: the batch may have been cancelled while waiting
+                if self._cancel.is_set():
+                    return False
+                self.post_status(f"{verb} {idx+1}/{total}: {fname}")
+                process_one(fpath, on_file_prog, on_file_log)
+            return True
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_one, idx, fpath): names[idx] for idx, fpath in enumerate(files)}
+            for future in as_completed(futures):
+                fname = futures[future]
+                try:
+                    if future.result():
+                        on_log(f"Success: {fname}")
+                    else:
+                        on_log(f"Skipped: {fname} (cancelled)")
+                except Exception as e:
+                    if self._cancel.is_set():
+                        on_log(f"Stopped: {fname} (cancelled)")
+                    else:
+                        on_log(f"Failed: {fname} ({e})")
+
+    def run_split_mode(self, files, names, custom_output_dir, options, on_log, on_prog):
+        """Run split video processing"""
+        from video_processor import split_video
+        
+        threads = _encoder_threads(len(files))
+        
+        def process_one(fpath, on_file_prog, on_file_log):
+            split_video(fpath, output_dir=custom_output_dir, threads=threads, cancel_event=self._cancel, on_progress=on_file_prog, on_log=on_file_log, **options)
+        
+        self.run_file_pool(files, names, custom_output_dir, "Processing", process_one, on_log, on_prog)
+
+    def run_audio_mode(self, files, names, custom_output_dir, options, on_log, on_prog):
         """Run audio extraction processing"""
-        audio_format = self.audio_format_var.get()
+        from video_processor import extract_audio
         
-        for idx, fpath in enumerate(self.file_queue):
-            fname = os.path.basename(fpath)
-            self.after(0, lambda: self.label_status.configure(text=f"Extracting {idx+1}/{len(self.file_queue)}: {fname}"))
-            try:
-                extract_audio(fpath, output_format=audio_format, output_dir=custom_output_dir, on_progress=on_prog, on_log=on_log)
-                on_log(f"Success: {fname}")
-            except Exception as e:
-                on_log(f"Failed: {fname} ({e})")
+        def process_one(fpath, on_file_prog, on_file_log):
+            extract_audio(fpath, output_dir=custom_output_dir, cancel_event=self._cancel, on_progress=on_file_prog, on_log=on_file_log, **options)
+        
+        self.run_file_pool(files, names, custom_output_dir, "Extracting", process_one, on_log, on_prog)
 
-    def run_merge_mode(self, custom_output_dir, on_log, on_prog):
+    def run_merge_mode(self, files, names, custom_output_dir, options, on_log, on_prog):
         """Run video merge processing"""
-        if len(self.file_queue) < 2:
+        from video_processor import merge_videos
+        
+        if len(files) < 2:
             on_log("Error: At least 2 videos required for merging")
             return
         
@@ -667,38 +1125,25 @@ class VideoSplitterApp(ctk.CTk):
         if custom_output_dir:
             output_dir = Path(custom_output_dir).resolve()
         else:
-            output_dir = Path(self.file_queue[0]).parent
+            output_dir = Path(files[0]).parent
         
         # Generate output filename
         output_filename = "merged_video.mp4"
         output_path = output_dir / output_filename
         
         try:
-            merge_videos(self.file_queue, str(output_path), on_progress=on_prog, on_log=on_log)
-            on_log(f"Success: Merged {len(self.file_queue)} videos")
+            merge_videos(files, str(output_path), cancel_event=self._cancel, on_progress=on_prog, on_log=on_log)
+            on_log(f"Success: Merged {len(files)} videos")
         except Exception as e:
             on_log(f"Failed to merge: {e}")
 
-    def run_trim_mode(self, custom_output_dir, on_log, on_prog):
+    def run_trim_mode(self, files, names, custom_output_dir, options, on_log, on_prog):
         """Run video trim processing"""
-        try:
-            start_time = float(self.entry_trim_start.get())
-            end_time = float(self.entry_trim_end.get())
-        except ValueError:
-            on_log("Error: Invalid time values")
-            return
+        from video_processor import trim_video
         
-        precise_mode = (self.var_precise_mode.get() == 1)
+        threads = _encoder_threads(len(files))
         
-        for idx, fpath in enumerate(self.file_queue):
-            fname = os.path.basename(fpath)
-            self.after(0, lambda: self.label_status.configure(text=f"Trimming {idx+1}/{len(self.file_queue)}: {fname}"))
-            try:
-                trim_video(fpath, start_time=start_time, end_time=end_time, output_dir=custom_output_dir, precise_mode=precise_mode, on_progress=on_prog, on_log=on_log)
-                on_log(f"Success: {fname}")
-            except Exception as e:
-                on_log(f"Failed: {fname} ({e})")
+        def process_one(fpath, on_file_prog, on_file_log):
+            trim_video(fpath, output_dir=custom_output_dir, threads=threads, cancel_event=self._cancel, on_progress=on_file_prog, on_log=on_file_log, **options)
         
-        self.after(0, lambda: self.btn_run.configure(state="normal"))
-        self.after(0, lambda: self.label_status.configure(text="Done"))
-        self.after(0, lambda: self.progress_bar.set(1.0))
\ No newline at end of file
+        self.run_file_pool(files, names, custom_output_dir, "Trimming", process_one, on_log, on_prog)
\ No newline at end of file
@@ -1,7 +1,15 @@
 import os
+import bisect
+import collections
+import functools
+import math
 import subprocess
 import zipfile
 import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, List, Optional
 import imageio_ffmpeg
@@ -15,30 +23,98 @@ def get_ffmpeg_binary() -> str:
 
 FFMPEG_EXE = get_ffmpeg_binary()
 
+# Keep FFMPEG/FFPROBE from flashing a console window on Windows
+STARTUPINFO = None
+CREATIONFLAGS = 0
+if os.name == 'nt':
+    STARTUPINFO = subprocess.STARTUPINFO()
+    STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    CREATIONFLAGS = subprocess.CREATE_NO_WINDOW
+
+def get_ffprobe_binary() -> Optional[str]:
+    """Find FFPROBE next to FFMPEG or on PATH (imageio_ffmpeg doesn't bundle it)"""
+    ffmpeg_path = Path(FFMPEG_EXE)
+    sibling = ffmpeg_path.with_name(ffmpeg_path.name.replace("ffmpeg", "ffprobe", 1))
+    if sibling != ffmpeg_path and sibling.is_file():
+        return str(sibling)
+    return shutil.which("ffprobe")
+
+FFPROBE_EXE = get_ffprobe_binary()
+
+# MP4 parts are already compressed, so archives just store them
+ZIP_COMPRESSION = zipfile.ZIP_STORED
+ZIP_WORKERS = min(8, os.cpu_count() or 1)  # Parallel archives in INDIVIDUAL mode
+
+# Input options spliced in before "-i" (and before the FFPROBE input): a smaller
+# probe window shortens startup, and fastseek uses the index when seeking for stream copy
+FAST_INPUT_FLAGS = ["-probesize", "5M", "-analyzeduration", "1000000"]
+FAST_READ_FLAGS = ["-fflags", "+fastseek"]
+
+# Only errors go to stderr, and only the tail is kept for error messages
+FFMPEG_QUIET_FLAGS = ["-loglevel", "error", "-nostats"]
+STDERR_TAIL_LINES = 64
+
+# Regex to extract 'Duration: 00:00:00.00' from FFMPEG's banner
+_DURATION_RE = re.compile(rb"Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})")
+_AUDIO_CODEC_RE = re.compile(rb"Stream #\S+.*?: Audio: (\w+)")
+
+# Output format -> (encoder, source codec that can be copied as-is)
+AUDIO_CODECS = {
+    "mp3": ("libmp3lame", "mp3"),
+    "aac": ("aac", "aac"),
+    "wav": ("pcm_s16le", "pcm_s16le"),
+}
+
 def get_video_duration(file_path: str) -> float:
     """
-    Retrieves video duration using FFMPEG directly (No MoviePy).
-    This is much faster and prevents 'loading' hangs.
+    Retrieves video duration, probing each version of a file only once.
+    Editing or replacing the file changes its stat key, so stale entries are never hit.
     """
-    cmd = [FFMPEG_EXE, "-i", file_path]
-    
-    # Hide window on Windows
-    startupinfo = None
-    if os.name == 'nt':
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    resolved = os.path.abspath(file_path)
+    st = os.stat(resolved)
+    return _duration_cached(resolved, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=512)
+def _duration_cached(file_path: str, mtime_ns: int, size: int) -> float:
+    """
+    Retrieves video duration using FFPROBE, which stops after the container
+    header. Falls back to parsing FFMPEG's banner when FFPROBE isn't available.
+    """
+    if FFPROBE_EXE:
+        # Probe limits must come before the input to take effect
+        cmd = [
+            FFPROBE_EXE, "-v", "error",
+            *FAST_INPUT_FLAGS,
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            file_path
+        ]
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            startupinfo=STARTUPINFO,
+            creationflags=CREATIONFLAGS,
+            text=True
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            pass  # e.g. "N/A" for some streams; let FFMPEG have a look
+
+    cmd = [FFMPEG_EXE, *FAST_INPUT_FLAGS, "-i", file_path]
 
     # FFMPEG prints metadata to stderr, not stdout
     result = subprocess.run(
         cmd, 
-        stdout=subprocess.PIPE, 
+        stdout=subprocess.DEVNULL, 
         stderr=subprocess.PIPE, 
-        startupinfo=startupinfo,
-        text=True
+        startupinfo=STARTUPINFO,
+        creationflags=CREATIONFLAGS
     )
     
-    # Regex to extract 'Duration: 00:00:00.00'
-    duration_match = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})", result.stderr)
+    # Match the raw bytes; the banner never needs decoding
+    duration_match = _DURATION_RE.search(result.stderr)
     if duration_match:
         hours, minutes, seconds = map(float, duration_match.groups())
         total_seconds = hours * 3600 + minutes * 60 + seconds
@@ -46,6 +122,236 @@ def get_video_duration(file_path: str) -> float:
     
     raise ValueError(f"Could not extract duration from FFMPEG. File might be corrupt: {file_path}")
 
+def get_audio_codec(file_path: str) -> Optional[str]:
+    """Codec name of the first audio stream, or None if there isn't one (memoized like durations)"""
+    resolved = os.path.abspath(file_path)
+    st = os.stat(resolved)
+    return _audio_codec_cached(resolved, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=512)
+def _audio_codec_cached(file_path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Probe the first audio stream's codec with FFPROBE, or FFMPEG's banner as a fallback"""
+    if FFPROBE_EXE:
+        cmd = [
+            FFPROBE_EXE, "-v", "error",
+            *FAST_INPUT_FLAGS,
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            file_path
+        ]
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            startupinfo=STARTUPINFO,
+            creationflags=CREATIONFLAGS,
+            text=True
+        )
+        return result.stdout.strip() or None
+
+    result = subprocess.run(
+        [FFMPEG_EXE, *FAST_INPUT_FLAGS, "-i", file_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        startupinfo=STARTUPINFO,
+        creationflags=CREATIONFLAGS
+    )
+    codec_match = _AUDIO_CODEC_RE.search(result.stderr)
+    return codec_match.group(1).decode('ascii') if codec_match else None
+
+def get_keyframe_times(file_path: str) -> tuple:
+    """
+    Sorted keyframe timestamps of the first video stream, relative to the start
+    of the file as -ss and -segment_times count them (empty without FFPROBE; memoized)
+    """
+    resolved = os.path.abspath(file_path)
+    st = os.stat(resolved)
+    return _keyframes_cached(resolved, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=64)
+def _keyframes_cached(file_path: str, mtime_ns: int, size: int) -> tuple:
+    """List keyframes from packet flags, which needs no decoding, shifted by the container start time"""
+    if not FFPROBE_EXE:
+        return ()
+
+    cmd = [
+        FFPROBE_EXE, "-v", "error",
+        *FAST_INPUT_FLAGS,
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags:format=start_time",
+        "-of", "csv",
+        file_path
+    ]
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        startupinfo=STARTUPINFO,
+        creationflags=CREATIONFLAGS,
+        text=True
+    )
+    # Lines are "packet,<pts_time>,<flags>" plus one "format,<start_time>".
+    # PTS are absolute, and MPEG-TS or B-frame MP4s don't start at 0
+    times = []
+    start_time = 0.0
+    for line in result.stdout.splitlines():
+        fields = line.split(",")
+        try:
+            if fields[0] == "packet" and len(fields) > 2 and "K" in fields[2]:
+                times.append(float(fields[1]))
+            elif fields[0] == "format" and len(fields) > 1:
+                start_time = float(fields[1])
+        except ValueError:
+            pass  # Packets without a timestamp, or "N/A"
+    return tuple(sorted(max(0.0, t - start_time) for t in times))
+
+# Shortest part or trim that snapping to a keyframe may leave, in seconds
+MIN_SNAPPED_LENGTH = 0.5
+
+def _snap_to_keyframe(keyframes: tuple, t: float, tolerance: float) -> Optional[float]:
+    """Nearest keyframe to t if it lies within tolerance, else None"""
+    idx = bisect.bisect_left(keyframes, t)
+    nearby = keyframes[max(0, idx - 1):idx + 1]
+    if not nearby:
+        return None
+    nearest = min(nearby, key=lambda k: abs(k - t))
+    return nearest if abs(nearest - t) <= tolerance else None
+
+# Hardware H.264 encoders in order of preference, falling back to x264
+H264_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_amf", "libx264"]
+ENCODER_TEST_TIMEOUT = 15 # Seconds allowed for the one-frame test encode of a hardware encoder
+
+def _encoder_works(encoder: str) -> bool:
+    """Encode one synthetic frame to check the GPU and driver behind an encoder are usable"""
+    cmd = [
+        FFMPEG_EXE, "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=black:s=256x144:d=0.1",
+        "-frames:v", "1",
+        "-c:v", encoder,
+        "-f", "null", "-"
+    ]
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            startupinfo=STARTUPINFO,
+            creationflags=CREATIONFLAGS,
+            timeout=ENCODER_TEST_TIMEOUT
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    return result.returncode == 0
+
+@functools.lru_cache(maxsize=None)
+def get_h264_encoder() -> str:
+    """
+    First H.264 encoder from H264_ENCODERS that actually works here (probed once).
+    FFMPEG builds list NVENC/QSV/AMF whether or not the GPU exists, so each
+    candidate is checked with a test encode before it is trusted.
+    """
+    result = subprocess.run(
+        [FFMPEG_EXE, "-hide_banner", "-encoders"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        startupinfo=STARTUPINFO,
+        creationflags=CREATIONFLAGS,
+        text=True,
+        errors='ignore'
+    )
+    # Lines look like " V....D h264_nvenc   NVIDIA NVENC H.264 encoder"
+    available = {fields[1] for fields in (line.split() for line in result.stdout.splitlines()) if len(fields) > 1}
+    for name in H264_ENCODERS:
+        if name == "libx264":
+            break
+        if name in available and _encoder_works(name):
+            return name
+    return "libx264"
+
+def _h264_encode_args(preset: str, crf: int, threads: int, hw_encode: bool) -> List[str]:
+    """Video encoder options for a re-encode, mapping x264's quality knobs onto the chosen encoder"""
+    encoder = get_h264_encoder() if hw_encode else "libx264"
+    # Forced keyframes must be IDR frames: the segment muxer only cuts on packets
+    # flagged as keyframes, and these encoders otherwise emit plain I-frames
+    if encoder == "h264_nvenc":
+        return ["-c:v", encoder, "-preset", "p4", "-rc", "vbr", "-cq", str(crf), "-forced-idr", "1"]
+    if encoder == "h264_qsv":
+        return ["-c:v", encoder, "-global_quality", str(crf), "-forced_idr", "1"]
+    if encoder == "h264_amf":
+        return ["-c:v", encoder, "-rc", "cqp", "-qp_i", str(crf), "-qp_p", str(crf), "-forced_idr", "1"]
+    if encoder == "h264_videotoolbox":
+        # No CRF mapping: VideoToolbox's constant-quality -q:v only exists on
+        # Apple Silicon, so it keeps its default rate control and crf is ignored
+        return ["-c:v", encoder]
+    return ["-c:v", "libx264", "-preset", preset, "-crf", str(crf), "-threads", str(threads)]
+
+def _run_ffmpeg_with_progress(
+    cmd: List[str],
+    duration: float,
+    on_progress: Callable[[float], None],
+    cancel_event: Optional[threading.Event] = None,
+    output_path: Optional[Path] = None
+) -> None:
+    """
+    Run an FFMPEG command, reporting progress from its -progress stream.
+    
+    Args:
+        cmd: FFMPEG command line, starting with the binary
+        duration: Length of the output timeline in seconds
+        on_progress: Called with the fraction of the timeline written so far
+        cancel_event: When set, FFMPEG is stopped at its next progress report
+        output_path: Output file to delete if the run is cancelled (optional)
+    
+    Raises:
+        RuntimeError: If FFMPEG exits with an error or is cancelled
+    """
+    process = subprocess.Popen(
+        [cmd[0], "-progress", "pipe:1", *FFMPEG_QUIET_FLAGS] + cmd[1:],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        startupinfo=STARTUPINFO,
+        creationflags=CREATIONFLAGS,
+        text=True,
+        errors='ignore'
+    )
+    
+    # Drain stderr on the side so FFMPEG can't block on a full pipe,
+    # keeping just the last lines for the error message
+    stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+    reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+    reader.start()
+    
+    # Progress arrives as key=value lines; out_time_ms is in microseconds
+    # (newer builds also send out_time_us, which would just repeat it)
+    cancelled = False
+    for line in process.stdout:
+        if cancel_event is not None and cancel_event.is_set():
+            cancelled = True
+            process.terminate()
+            break
+        key, _, value = line.strip().partition("=")
+        if key == "out_time_ms" and duration > 0:
+            try:
+                on_progress(min(int(value) / 1_000_000 / duration, 1.0))
+            except ValueError:
+                pass  # "N/A" before the first frame
+    
+    process.wait()
+    reader.join()
+    process.stdout.close()
+    process.stderr.close()
+    if cancelled:
+        # Don't leave a truncated file behind
+        if output_path is not None:
+            try:
+                os.unlink(output_path)
+            except OSError:
+                pass
+        raise RuntimeError("Operation cancelled")
+    if process.returncode != 0:
+        raise RuntimeError(f"FFMPEG Error: {''.join(stderr_tail)}")
+
 def split_video(
     file_path: str,
     parts: Optional[int] = None,
@@ -56,6 +362,12 @@ def split_video(
     precise_mode: bool = False,
     output_dir: Optional[str] = None,
     naming_pattern: Optional[str] = None,
+    preset: str = "fast",
+    crf: int = 23,
+    threads: int = 0,
+    keyframe_tolerance: float = 1.0,
+    hw_encode: bool = False,
+    cancel_event: Optional[threading.Event] = None,
     on_progress: Callable[[float], None] = lambda x: None,
     on_log: Callable[[str], None] = lambda x: None
 ) -> None:
@@ -125,12 +437,9 @@ def split_video(
             on_log(f"File Size: {file_size_mb:.2f}MB | Target: {target_size_mb:.2f}MB")
             on_log(f"Bitrate: {bitrate_bps/1024:.2f} kbps | {total_parts} parts @ {part_duration:.2f}s each")
 
-        # 2. Split Loop
+        # 2. Name every part up front
+        part_names = []
         for i in range(total_parts):
-            start_time = i * part_duration
-            end_time = (i + 1) * part_duration
-            if i == total_parts - 1: end_time = duration
-            
             # Generate output filename based on naming pattern or default
             if naming_pattern:
                 # Use custom naming pattern with variables
@@ -149,73 +458,133 @@ def split_video(
             else:
                 # Use default naming
                 output_filename = f"{input_path.stem}_part{i+1}.mp4"
+            part_names.append(output_filename)
+
+        # 3. Write all parts in one linear pass with the segment muxer
+        cut_times = [i * part_duration for i in range(1, total_parts)]
+        
+        if precise_mode and cut_times and keyframe_tolerance > 0:
+            # If every cut is already close to a keyframe, stream copy gives
+            # near-exact parts without re-encoding anything
+            keyframes = get_keyframe_times(str(input_path))
+            snapped = [_snap_to_keyframe(keyframes, t, keyframe_tolerance) for t in cut_times]
+            # Every part must keep some length: a cut snapped to 0s or to the end
+            # would be an empty segment the muxer never writes, shifting the plan
+            bounds = [0.0, *snapped, duration] if all(k is not None for k in snapped) else []
+            if bounds and all(b - a >= MIN_SNAPPED_LENGTH for a, b in zip(bounds, bounds[1:])):
+                on_log(f"  > All cuts are within {keyframe_tolerance:g}s of a keyframe, stream copying instead of re-encoding")
+                precise_mode = False
+                # The segment muxer cuts at the first keyframe at or after each time,
+                # so nudge below it so rounding can't push the cut to the next one
+                cut_times = [k - 0.0005 for k in snapped]
+        
+        cut_points = ",".join(f"{t:.3f}" for t in cut_times)
+        # Segments go to a private folder, so this run can't clash with another
+        # split of a same-named file. The muxer reads the output path as a
+        # printf template, so any % already in the folder path must be doubled
+        segment_dir = Path(tempfile.mkdtemp(prefix=".segments_", dir=output_dir))
+        segment_template = str(segment_dir).replace("%", "%%") + os.sep + "seg%03d.mp4"
+        segment_list = segment_dir / "segments.csv"
+        
+        cmd = [FFMPEG_EXE, "-y", *FAST_INPUT_FLAGS, "-i", str(input_path)]
+        if precise_mode:
+            # Re-encode with keyframes forced at every cut (slower but exact)
+            encode_args = _h264_encode_args(preset, crf, threads, hw_encode)
+            on_log(f"  > Re-encoding {total_parts} parts in one pass with {encode_args[1]} (Precise Mode)...")
+            cmd += [*encode_args, "-c:a", "aac"]
+            if cut_points:
+                cmd += ["-force_key_frames", cut_points]
+        else:
+            # Stream copy (fast, cuts land on the next keyframe)
+            cmd += ["-c", "copy"]
+        
+        cmd += ["-f", "segment", "-reset_timestamps", "1"]
+        if cut_points:
+            cmd += ["-segment_times", cut_points]
+        else:
+            # A single part: make sure the muxer never splits on its own
+            cmd += ["-segment_time", f"{duration + 1:.3f}"]
+        cmd += [
+            "-segment_list", str(segment_list),
+            "-segment_list_type", "csv",
+            segment_template
+        ]
+        
+        try:
+            _run_ffmpeg_with_progress(cmd, duration, on_progress, cancel_event)
             
-            output_file_path = output_dir / output_filename
-            generated_files.append(output_file_path)
-            
-            # Build FFMPEG command
-            if precise_mode:
-                # Re-encode for precise cuts (slower but more accurate)
-                cmd = [
-                    FFMPEG_EXE, "-y",
-                    "-i", str(input_path),
-                    "-ss", f"{start_time:.3f}",
-                    "-to", f"{end_time:.3f}",
-                    "-c:v", "libx264",
-                    "-c:a", "aac",
-                    "-preset", "fast",
-                    "-crf", "23",
-                    str(output_file_path)
-                ]
-                on_log(f"  > Re-encoding part {i+1} (Precise Mode)...")
-            else:
-                # Stream copy (fast, less precise)
-                cmd = [
-                    FFMPEG_EXE, "-y",
-                    "-i", str(input_path),
-                    "-ss", f"{start_time:.3f}",
-                    "-to", f"{end_time:.3f}",
-                    "-c", "copy",
-                    str(output_file_path)
-                ]
+            # The csv lists segments in order as "filename,start,end"
+            with open(segment_list, 'r', encoding='utf-8') as f:
+                segment_files = [line.rsplit(",", 2)[0].strip('"') for line in f if line.strip()]
             
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            process = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=startupinfo
-            )
+            if len(segment_files) != total_parts:
+                on_log(f"Warning: FFMPEG wrote {len(segment_files)} parts instead of {total_parts}")
             
-            if process.returncode != 0:
-                raise RuntimeError(f"FFMPEG Error: {process.stderr.decode('utf-8', errors='ignore')}")
-
-            on_progress((i + 1) / total_parts)
-            on_log(f"  > Created: {output_filename}")
+            for idx, segment_name in enumerate(segment_files):
+                segment_path = segment_dir / segment_name
+                output_filename = part_names[idx] if idx < total_parts else f"{input_path.stem}_part{idx+1}.mp4"
+                output_file_path = output_dir / output_filename
+                os.replace(segment_path, output_file_path)
+                generated_files.append(output_file_path)
+                on_log(f"  > Created: {output_filename}")
+        finally:
+            # Drops the segment list and, on failure, any half-written segments
+            shutil.rmtree(segment_dir, ignore_errors=True)
+        
+        on_progress(1.0)
 
-        # 3. Archiving Logic
+        # 4. Archiving Logic
+        # One directory listing instead of a stat per part
+        existing = set()
+        for parent in {file_p.parent for file_p in generated_files}:
+            with os.scandir(parent) as entries:
+                existing.update(Path(entry.path) for entry in entries)
+        parts_on_disk = [file_p for file_p in generated_files if file_p in existing]
+        
         if archive_mode == 'BUNDLE':
             archive_path = output_dir / f"{input_path.stem}_bundle.zip"
             on_log(f"Bundling all parts into {archive_path.name}...")
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for file_p in generated_files:
-                    if file_p.exists(): zf.write(file_p, arcname=file_p.name)
+            with zipfile.ZipFile(archive_path, 'w', ZIP_COMPRESSION, allowZip64=True) as zf:
+                for file_p in parts_on_disk:
+                    zf.write(file_p, arcname=file_p.name)
         
         elif archive_mode == 'INDIVIDUAL':
             on_log("Zipping parts individually...")
-            for file_p in generated_files:
-                if file_p.exists():
-                    zip_path = file_p.with_suffix('.zip')
-                    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        zf.write(file_p, arcname=file_p.name)
+            
+            def zip_one(file_p):
+                zip_path = file_p.with_suffix('.zip')
+                with zipfile.ZipFile(zip_path, 'w', ZIP_COMPRESSION, allowZip64=True) as zf:
+                    zf.write(file_p, arcname=file_p.name)
+            
+            # Storing is pure disk I/O, so the archives overlap well on threads
+            with ThreadPoolExecutor(max_workers=ZIP_WORKERS) as executor:
+                list(executor.map(zip_one, parts_on_disk))
+        
+        elif archive_mode == 'MANIFEST':
+            # Hardlinks package the parts without copying any data
+            bundle_dir = output_dir / f"{input_path.stem}_bundle"
+            bundle_dir.mkdir(exist_ok=True)
+            on_log(f"Collecting parts into {bundle_dir.name}...")
+            for file_p in parts_on_disk:
+                link_path = bundle_dir / file_p.name
+                try:
+                    try:
+                        os.unlink(link_path)  # Replace a link from a previous run
+                    except FileNotFoundError:
+                        pass
+                    os.link(file_p, link_path)
+                except OSError:
+                    # Cross-device or no hardlink support
+                    shutil.copy2(file_p, link_path)
+            playlist = "\n".join(file_p.name for file_p in parts_on_disk) + "\n"
+            (bundle_dir / "playlist.m3u").write_text(playlist, encoding='utf-8')
 
-        # 4. Cleanup
+        # 5. Cleanup
         if cleanup_raw and archive_mode != 'NONE':
             on_log("Removing raw .mp4 parts...")
-            for file_p in generated_files:
+            for file_p in parts_on_disk:
                 try:
-                    if file_p.exists(): file_p.unlink()
+                    os.unlink(file_p)
                 except OSError: pass
 
     except Exception as e:
@@ -226,6 +595,7 @@ def extract_audio(
     file_path: str,
     output_format: str = "mp3",
     output_dir: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None,
     on_progress: Callable[[float], None] = lambda x: None,
     on_log: Callable[[str], None] = lambda x: None
 ) -> None:
@@ -236,6 +606,7 @@ def extract_audio(
         file_path: Path to input video file
         output_format: Output audio format (mp3, wav, aac, etc.)
         output_dir: Custom output directory (optional)
+        cancel_event: Stops FFMPEG when set (optional)
         on_progress: Progress callback (0.0 to 1.0)
         on_log: Log callback for status messages
     """
@@ -256,29 +627,34 @@ def extract_audio(
     
     on_log(f"Extracting audio from {input_path.name}...")
     
-    # Build FFMPEG command for audio extraction
-    cmd = [
-        FFMPEG_EXE, "-y",
-        "-i", str(input_path),
-        "-vn",  # No video
-        "-acodec", "libmp3lame" if output_format == "mp3" else "pcm_s16le",
-        "-ab", "192k",
-        "-ar", "44100",
-        str(output_file_path)
-    ]
-    
-    startupinfo = None
-    if os.name == 'nt':
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    encoder, copyable_codec = AUDIO_CODECS.get(output_format, AUDIO_CODECS["mp3"])
     
     try:
-        process = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=startupinfo
-        )
+        # Build FFMPEG command for audio extraction
+        cmd = [
+            FFMPEG_EXE, "-y",
+            *FAST_INPUT_FLAGS,
+            "-i", str(input_path),
+            "-vn",  # No video
+        ]
+        if get_audio_codec(str(input_path)) == copyable_codec:
+            # Source audio is already in the target codec: copy the packets
+            on_log("  > Audio already matches the output format, copying stream...")
+            cmd += ["-acodec", "copy"]
+        else:
+            cmd += [
+                "-acodec", encoder,
+                "-ab", "192k",
+                "-ar", "44100",
+            ]
+        cmd.append(str(output_file_path))
         
-        if process.returncode != 0:
-            raise RuntimeError(f"FFMPEG Error: {process.stderr.decode('utf-8', errors='ignore')}")
+        # Duration only scales the progress bar, so an unprobeable file still extracts
+        try:
+            duration = get_video_duration(str(input_path))
+        except ValueError:
+            duration = 0
+        _run_ffmpeg_with_progress(cmd, duration, on_progress, cancel_event, output_file_path)
         
         on_progress(1.0)
         on_log(f"Audio extracted: {output_filename}")
@@ -287,59 +663,80 @@ def extract_audio(
         on_log(f"Error extracting audio: {str(e)}")
         raise e
 
+# Containers that can be joined byte-for-byte with the concat protocol
+CONCAT_PROTOCOL_EXTS = frozenset({'.ts', '.mpg', '.mpeg'})
+
+def _inputs_concat_protocol_safe(file_paths: List[str]) -> bool:
+    """Whether every input is a stream format the concat protocol can join directly"""
+    return all(Path(file_path).suffix.lower() in CONCAT_PROTOCOL_EXTS for file_path in file_paths)
+
 def merge_videos(
     file_paths: List[str],
     output_path: str,
+    cancel_event: Optional[threading.Event] = None,
     on_progress: Callable[[float], None] = lambda x: None,
     on_log: Callable[[str], None] = lambda x: None
 ) -> None:
     """
-    Merge multiple videos into one file using FFMPEG concat demuxer.
+    Merge multiple videos into one file using FFMPEG concat demuxer, or the
+    concat protocol when every input is an MPEG-TS/PS stream.
     
     Args:
         file_paths: List of input video file paths
         output_path: Path for output merged video
+        cancel_event: Stops FFMPEG when set (optional)
         on_progress: Progress callback (0.0 to 1.0)
         on_log: Log callback for status messages
     """
     if not file_paths:
         raise ValueError("No files provided for merging")
     
-    # Create temporary concat list file
-    concat_list_path = Path(output_path).parent / "concat_list.txt"
+    concat_list_path = None
     
     try:
-        # Write concat list file
-        with open(concat_list_path, 'w', encoding='utf-8') as f:
-            for file_path in file_paths:
-                # Use absolute paths and escape special characters
-                abs_path = Path(file_path).resolve()
-                f.write(f"file '{abs_path}'\n")
-        
-        on_log(f"Created concat list with {len(file_paths)} files")
-        
-        # Build FFMPEG command for concat demuxer
-        cmd = [
-            FFMPEG_EXE, "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_list_path),
-            "-c", "copy",
-            str(output_path)
-        ]
+        if _inputs_concat_protocol_safe(file_paths):
+            # Transport streams concatenate as plain bytes: no list file needed
+            concat_input = "concat:" + "|".join(str(Path(file_path).resolve()) for file_path in file_paths)
+            cmd = [
+                FFMPEG_EXE, "-y",
+                "-i", concat_input,
+                "-c", "copy",
+                str(output_path)
+            ]
+        else:
+            # Build the whole concat list in memory and write it in one go. FFMPEG
+            # quotes like a shell minus double quotes: ' inside '...' becomes '\''
+            payload = "".join(
+                "file '{}'\n".format(str(Path(file_path).resolve()).replace("'", "'\\''"))
+                for file_path in file_paths
+            ).encode('utf-8')
+            
+            # Keep the list in the temp dir so it never collides with the output folder
+            with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as tf:
+                tf.write(payload)
+                concat_list_path = Path(tf.name)
+            
+            on_log(f"Created concat list with {len(file_paths)} files")
+            
+            # Build FFMPEG command for concat demuxer
+            cmd = [
+                FFMPEG_EXE, "-y",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(concat_list_path),
+                "-c", "copy",
+                str(output_path)
+            ]
         
-        startupinfo = None
-        if os.name == 'nt':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        # The merged timeline is the inputs laid end to end. It only scales the
+        # progress bar, so an unprobeable input just disables streamed progress
+        try:
+            total_duration = sum(get_video_duration(file_path) for file_path in file_paths)
+        except ValueError:
+            total_duration = 0
         
         on_log("Merging videos...")
-        process = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=startupinfo
-        )
-        
-        if process.returncode != 0:
-            raise RuntimeError(f"FFMPEG Error: {process.stderr.decode('utf-8', errors='ignore')}")
+        _run_ffmpeg_with_progress(cmd, total_duration, on_progress, cancel_event, Path(output_path))
         
         on_progress(1.0)
         on_log(f"Merge complete: {Path(output_path).name}")
@@ -349,9 +746,9 @@ def merge_videos(
         raise e
     finally:
         # Clean up temporary concat list
-        if concat_list_path.exists():
+        if concat_list_path is not None:
             try:
-                concat_list_path.unlink()
+                os.unlink(concat_list_path)
             except OSError:
                 pass
 
@@ -361,6 +758,12 @@ def trim_video(
     end_time: float,
     output_dir: Optional[str] = None,
     precise_mode: bool = False,
+    preset: str = "fast",
+    crf: int = 23,
+    threads: int = 0,
+    keyframe_tolerance: float = 1.0,
+    hw_encode: bool = False,
+    cancel_event: Optional[threading.Event] = None,
     on_progress: Callable[[float], None] = lambda x: None,
     on_log: Callable[[str], None] = lambda x: None
 ) -> None:
@@ -373,6 +776,13 @@ def trim_video(
         end_time: End time in seconds
         output_dir: Custom output directory (optional)
         precise_mode: Whether to re-encode (slower but more accurate)
+        preset: x264 preset used when re-encoding
+        crf: x264 quality used when re-encoding (lower is better)
+        threads: Encoder threads when re-encoding (0 lets FFMPEG use all cores)
+        keyframe_tolerance: In precise mode, stream copy instead when the start
+            is within this many seconds of a keyframe (0 always re-encodes)
+        hw_encode: In precise mode, use a hardware H.264 encoder if one works on this machine
+        cancel_event: Stops FFMPEG when set (optional)
         on_progress: Progress callback (0.0 to 1.0)
         on_log: Log callback for status messages
     """
@@ -405,44 +815,49 @@ def trim_video(
     
     on_log(f"Trimming {input_path.name}: {start_time}s to {end_time}s")
     
+    if precise_mode and keyframe_tolerance > 0:
+        # Only the start needs a keyframe; a copy can end on any packet
+        keyframe = _snap_to_keyframe(get_keyframe_times(str(input_path)), start_time, keyframe_tolerance)
+        # A keyframe at or past the end would leave nothing to copy
+        if keyframe is not None and end_time - keyframe >= MIN_SNAPPED_LENGTH:
+            on_log(f"Start is within {keyframe_tolerance:g}s of a keyframe at {keyframe:.3f}s, stream copying instead of re-encoding")
+            precise_mode = False
+            # Input seeking lands on the keyframe at or before -ss, so round up
+            # to the next millisecond rather than risk landing a whole GOP early
+            start_time = math.ceil(keyframe * 1000) / 1000
+    
     # Build FFMPEG command for trimming
     if precise_mode:
         # Re-encode for precise cuts
+        encode_args = _h264_encode_args(preset, crf, threads, hw_encode)
         cmd = [
             FFMPEG_EXE, "-y",
+            *FAST_INPUT_FLAGS,
             "-i", str(input_path),
             "-ss", f"{start_time:.3f}",
             "-to", f"{end_time:.3f}",
-            "-c:v", "libx264",
+            *encode_args,
             "-c:a", "aac",
-            "-preset", "fast",
-            "-crf", "23",
             str(output_file_path)
         ]
-        on_log("Re-encoding (Precise Mode)...")
+        on_log(f"Re-encoding with {encode_args[1]} (Precise Mode)...")
     else:
-        # Stream copy (fast)
+        # Stream copy (fast). Seeking before the input jumps straight to the
+        # nearest keyframe instead of reading from the start of the file
         cmd = [
             FFMPEG_EXE, "-y",
-            "-i", str(input_path),
+            *FAST_INPUT_FLAGS,
+            *FAST_READ_FLAGS,
             "-ss", f"{start_time:.3f}",
-            "-to", f"{end_time:.3f}",
+            "-i", str(input_path),
+            "-t", f"{end_time - start_time:.3f}",
             "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
             str(output_file_path)
         ]
     
-    startupinfo = None
-    if os.name == 'nt':
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    
     try:
-        process = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=startupinfo
-        )
-        
-        if process.returncode != 0:
-            raise RuntimeError(f"FFMPEG Error: {process.stderr.decode('utf-8', errors='ignore')}")
+        _run_ffmpeg_with_progress(cmd, end_time - start_time, on_progress, cancel_event, output_file_path)
         
         on_progress(1.0)
         on_log(f"Trim complete: {output_filename}")